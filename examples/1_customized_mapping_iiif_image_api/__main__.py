@@ -3,11 +3,20 @@ from pathlib import Path
 from lxml import etree
 
 from customized_mapping import MetsModsMapperWithIIIF
+from mets_to_edm.utilities import METS_PARSER_OPTIONS
+
+parser = etree.XMLParser(**METS_PARSER_OPTIONS)
 
 dir_path = Path(__file__).resolve().parent
-xml_tree = etree.parse(dir_path / "example-1.xml")
+# the example file is small, so it is read at once and parsed from a single buffer
+xml_tree = etree.fromstring(
+    (dir_path / "example-1.xml").read_bytes(), parser
+).getroottree()
 
 edmlib_record = MetsModsMapperWithIIIF.process_record(xml_tree)
 
-with open(dir_path / "example-1-output.xml", "w", encoding="utf-8") as out_file:
-    out_file.write(edmlib_record.serialize())
+# let rdflib write the encoded output directly to the file instead of building the whole document as a string first
+with open(dir_path / "example-1-output.xml", "wb", buffering=1 << 20) as out_file:
+    edmlib_record.get_rdf_graph().serialize(
+        destination=out_file, format="pretty-xml", max_depth=1
+    )
@@ -1,11 +1,70 @@
-import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from edmlib import Lit, MixedValuesList, Ref, SVCS_Service
 from mets_to_edm.mapper import MetsToEdmMapper
+from mets_to_edm.utilities import METS_MODS_NAMESPACES
+from lxml import etree
 from lxml.etree import _Element
 
 
+def _url_host(url: str) -> str:
+    return url.partition("://")[2].partition("/")[0]
+
+
+# Image URL prefixes mapped to the IIIF Image API endpoint of the image, more institutions can be added here
+_IIIF_TEMPLATES = {
+    f"{scheme}://www.digital.wienbibliothek.at/download/webcache/{size}/": "https://www.digital.wienbibliothek.at/i3f/v20/{image_id}"
+    for scheme in ("https", "http")
+    for size in ("304", "1000")
+}
+# the prefixes are indexed by host (longest first), so only the prefixes of the url's host have to be checked
+_IIIF_TEMPLATES_BY_HOST: Dict[str, List[Tuple[str, str]]] = {
+    host: [
+        (prefix, template)
+        for prefix, template in sorted(
+            _IIIF_TEMPLATES.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        if _url_host(prefix) == host
+    ]
+    for host in {_url_host(prefix) for prefix in _IIIF_TEMPLATES}
+}
+
+# identifier queries filtered by a prefix in libxml2, in the order of the base mapping's get_identifiers
+# the prefix is compared with the whitespace-normalized value, as the literals are stripped
+_XP_IDENTIFIERS_WITH_PREFIX = [
+    etree.XPath(
+        f"{query}[starts-with(normalize-space(), $prefix)]",
+        namespaces=METS_MODS_NAMESPACES,
+    )
+    for query in ("mods:recordInfo/mods:recordIdentifier", "mods:identifier")
+]
+
+_IIIF_IMAGE_API = Ref(value="http://iiif.io/api/image")
+_IIIF_CONFORMS_LIST = [_IIIF_IMAGE_API]
+_IIIF_LEVEL2 = Ref(value="http://iiif.io/api/image/2/level2.json")
+_PROVIDER = Lit(value="Kulturpool")
+
+
+@lru_cache(maxsize=4096)
+def _iiif_image_api_service(url: str) -> SVCS_Service | None:
+    # images are often referenced repeatedly, the service objects are never mutated by the mapping
+    for prefix, template in _IIIF_TEMPLATES_BY_HOST.get(_url_host(url), ()):
+        if url.startswith(prefix):
+            image_id = url[len(prefix) :]
+            break
+    else:
+        return None
+    if not image_id:
+        # bare prefix without image id
+        return None
+    return SVCS_Service(
+        id=Ref(value=template.format(image_id=image_id)),
+        dcterms_conformsTo=_IIIF_CONFORMS_LIST,
+        doap_implements=_IIIF_LEVEL2,
+    )
+
+
 class MetsModsMapperWithIIIF(MetsToEdmMapper):
     """Example of a customized mapping class with the following changes:
     - Only identifiers starting with "urn:" are kept
@@ -13,29 +72,24 @@ class MetsModsMapperWithIIIF(MetsToEdmMapper):
     - IIIF Image API service is extracted from a specific URL pattern for each url
     """
 
-    url_pattern = re.compile(
-        r"https?://www.digital.wienbibliothek.at/download/webcache/(?:304|1000)/(.+)$"
-    )
+    DESCRIPTIONS_ENABLED = False
 
     @classmethod
-    def get_identifiers(cls, dmd_sec: _Element) -> MixedValuesList:
+    def _identifiers_xpath(cls, dmd_sec: _Element, prefix: str) -> List[Lit]:
         return [
-            id for id in super().get_identifiers(dmd_sec) if id.value.startswith("urn:")
+            Lit(value=tag.text, lang=tag.get("lang"))
+            for xpath in _XP_IDENTIFIERS_WITH_PREFIX
+            for tag in xpath(dmd_sec, prefix=prefix)
         ]
 
     @classmethod
-    def get_iiif_image_api_service(cls, url) -> SVCS_Service | None:
-        image_id = cls.url_pattern.search(url).group(1)
-        return SVCS_Service(
-            id=Ref(value=f"https://www.digital.wienbibliothek.at/i3f/v20/{image_id}"),
-            dcterms_conformsTo=[Ref(value="http://iiif.io/api/image")],
-            doap_implements=Ref(value="http://iiif.io/api/image/2/level2.json"),
-        )
+    def get_identifiers(cls, dmd_sec: _Element) -> MixedValuesList:
+        return cls._identifiers_xpath(dmd_sec, prefix="urn:")
 
     @classmethod
-    def get_descriptions(cls, dmd_sec: _Element) -> MixedValuesList:
-        return []
+    def get_iiif_image_api_service(cls, url) -> SVCS_Service | None:
+        return _iiif_image_api_service(url)
 
     @classmethod
     def get_provider(cls, default: Optional[str] = None) -> Lit:
-        return Lit(value="Kulturpool")
+        return _PROVIDER
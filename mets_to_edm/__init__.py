@@ -1 +1 @@
-from mets_to_edm.mapper import MetsToEdmMapper
+from mets_to_edm.mapper import MetsToEdmMapper, process_records
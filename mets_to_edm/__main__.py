@@ -1,32 +1,238 @@
 import argparse
+import os
+import re
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import quoteattr
+
+from edmlib.edm.enums import EDM_Namespace
 from lxml import etree
 from mets_to_edm.mapper import MetsToEdmMapper
+from mets_to_edm.utilities import METS_PARSER_OPTIONS, mets_ns
+
+METS_ROOT_TAG = mets_ns("mets")
+# top-level METS sections that are not used by the mapping and are dropped while parsing
+UNUSED_SECTION_TAGS = tuple(
+    mets_ns(name) for name in ("metsHdr", "structLink", "behaviorSec")
+)
+RDF_NAMESPACE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
+
+def _is_valid_namespace_uri(uri: str) -> bool:
+    # e.g. the crm namespace of edmlib contains a soft hyphen, which XML parsers reject in a namespace declaration
+    try:
+        etree.fromstring(f"<n xmlns:n={quoteattr(uri)}/>")
+    except etree.XMLSyntaxError:
+        return False
+    return True
+
+
+# namespaces declared on the root of the --stream output, records using other namespaces keep their own declarations
+EDM_NSMAP = {
+    "rdf": RDF_NAMESPACE,
+    **{
+        prefix.lower(): str(namespace)
+        for prefix, namespace in EDM_Namespace.get_namespace_tuples()
+        if _is_valid_namespace_uri(str(namespace))
+    },
+}
+NAMESPACE_DECLARATION = re.compile(rb'xmlns:([\w.-]+)="([^"]*)"')
+
+
+def map_file(
+    path: str, edm_provider: str, data_provider: Optional[str] = None
+) -> Iterator[bytes]:
+    """Maps all mets:mets records of a file and yields the EDM records serialized as utf-8 encoded rdf/xml"""
+    with open(path, "rb") as f:
+        # stream the records so that files containing many mets:mets elements don't have to be kept in memory
+        for _, record in etree.iterparse(
+            f,
+            events=("end",),
+            tag=(METS_ROOT_TAG, *UNUSED_SECTION_TAGS),
+            **METS_PARSER_OPTIONS,
+        ):
+            if record.tag != METS_ROOT_TAG:
+                # e.g. the structLink holds an smLink for every page, it's removed as soon as it is parsed
+                section = record
+                parent = section.getparent()
+                if parent is not None and parent.tag == METS_ROOT_TAG:
+                    section.clear()
+                    parent.remove(section)
+                continue
+            # drop already processed records first (also when wrapped e.g. in OAI-PMH), they are not needed anymore
+            for element in (record, *record.iterancestors()):
+                parent = element.getparent()
+                if parent is None:
+                    # comments or processing instructions before the document root can't be removed
+                    break
+                while element.getprevious() is not None:
+                    del parent[0]
+            edm_record = MetsToEdmMapper.process_record(
+                record, edm_provider=edm_provider, data_provider=data_provider
+            )
+            # same output as edm_record.serialize(), but encoded directly by rdflib
+            yield edm_record.get_rdf_graph().serialize(
+                format="pretty-xml", max_depth=1, encoding="utf-8"
+            )
+            record.clear()
+
+
+def _map_file_in_worker(
+    path: str, edm_provider: str, data_provider: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    # the records are written to a temporary file as they are mapped instead of being collected and pickled,
+    # every record is preceded by its length
+    with tempfile.NamedTemporaryFile(
+        prefix="mets-to-edm-", suffix=".records", delete=False
+    ) as records_file:
+        try:
+            for serialized_record in map_file(path, edm_provider, data_provider):
+                records_file.write(len(serialized_record).to_bytes(8, "big"))
+                records_file.write(serialized_record)
+        except Exception as e:
+            # a failing file must not abort the others, lxml exceptions can't be pickled so the error is
+            # passed back to the main process as message
+            return records_file.name, f"{type(e).__name__}: {e}"
+    return records_file.name, None
+
+
+def _read_worker_records(path: str, future: Future) -> Iterator[bytes]:
+    records_path, error = future.result()
+    try:
+        with open(records_path, "rb") as records_file:
+            while length := records_file.read(8):
+                yield records_file.read(int.from_bytes(length, "big"))
+    finally:
+        os.remove(records_path)
+    if error:
+        print(f"Error mapping the file {path}: {error}", file=sys.stderr)
+
+
+def _remove_worker_records(future: Future):
+    if future.cancel():
+        return
+    try:
+        records_path, _ = future.result()
+        os.remove(records_path)
+    except Exception:
+        # only cleaning up, the error of the first failing file is already propagating
+        pass
+
+
+def map_files(
+    paths: List[str],
+    edm_provider: str,
+    data_provider: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Maps all given files and yields the serialized EDM records in the order of the files"""
+    if len(paths) == 1:
+        try:
+            yield from map_file(paths[0], edm_provider, data_provider)
+        except (etree.XMLSyntaxError, FileNotFoundError) as e:
+            print(f"Error parsing the file: {e}", file=sys.stderr)
+        return
+
+    # files are independent of each other, so they are mapped in parallel and written in the given order,
+    # only a few files per worker are submitted ahead of the file that is currently written
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending: Deque[Tuple[str, Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for path in paths:
+                pending.append(
+                    (
+                        path,
+                        executor.submit(
+                            _map_file_in_worker, path, edm_provider, data_provider
+                        ),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    yield from _read_worker_records(*pending.popleft())
+            while pending:
+                yield from _read_worker_records(*pending.popleft())
+        finally:
+            # e.g. when the output is closed early, the records of files that were not written are removed
+            for _, future in pending:
+                _remove_worker_records(future)
+
+
+def write_records(serialized_records: Iterable[bytes]):
+    # write the encoded bytes directly to stdout, records are separated by an empty line
+    for serialized_record in serialized_records:
+        sys.stdout.buffer.write(serialized_record)
+        sys.stdout.buffer.write(b"\n")
+
+
+def stream_records(serialized_records: Iterable[bytes]):
+    # write a single rdf:RDF document: the namespaces are declared once on the root and only the
+    # body of every record is written, records are never collected in memory
+    out = sys.stdout.buffer
+    out.write(b'<?xml version="1.0" encoding="utf-8"?>\n<rdf:RDF')
+    for prefix, namespace in EDM_NSMAP.items():
+        out.write(f'\n  xmlns:{prefix}="{namespace}"'.encode("utf-8"))
+    out.write(b"\n>\n")
+    for serialized_record in serialized_records:
+        root_start = serialized_record.index(b"<rdf:RDF")
+        body_start = serialized_record.index(b">", root_start) + 1
+        body_end = serialized_record.rfind(b"</rdf:RDF>")
+        if body_end == -1:
+            # empty record
+            continue
+        declarations = NAMESPACE_DECLARATION.findall(
+            serialized_record[root_start:body_start]
+        )
+        if all(
+            EDM_NSMAP.get(prefix.decode("utf-8")) == namespace.decode("utf-8")
+            for prefix, namespace in declarations
+        ):
+            out.write(serialized_record[body_start:body_end].lstrip(b"\n"))
+        else:
+            # the record uses prefixes that are not declared on the root, so every resource keeps its own declarations
+            for resource in etree.fromstring(serialized_record):
+                out.write(etree.tostring(resource, encoding="utf-8", with_tail=False))
+                out.write(b"\n")
+    out.write(b"</rdf:RDF>\n")
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Process a file with a specified data provider."
+        description="Process one or more files with a specified data provider."
+    )
+    parser.add_argument(
+        "file", type=str, nargs="+", help="Path(s) to the input file(s)"
     )
-    parser.add_argument("file", type=str, help="Path to the input file")
     parser.add_argument(
         "provider",
         type=str,
         help="Name of the edm:provider (institution providing the data to Europeana)",
     )
     parser.add_argument("--data-provider", type=str, help="Name of the data provider")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes used when processing multiple files",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write all records into a single rdf:RDF document instead of one document per record",
+    )
 
     args = parser.parse_args()
 
-    try:
-        with open(args.file, "rb") as f:
-            tree = etree.parse(f)
-            print(
-                MetsToEdmMapper.process_record(
-                    tree, edm_provider=args.provider, data_provider=args.data_provider
-                ).serialize()
-            )
-    except (etree.XMLSyntaxError, FileNotFoundError) as e:
-        print(f"Error parsing the file: {e}")
+    serialized_records = map_files(
+        args.file, args.provider, args.data_provider, workers=args.workers
+    )
+    if args.stream:
+        stream_records(serialized_records)
+    else:
+        write_records(serialized_records)
 
 
 if __name__ == "__main__":
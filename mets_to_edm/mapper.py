@@ -1,7 +1,20 @@
+import functools
 import logging
 import os
-from collections import defaultdict
-from typing import Any, Callable, Optional, Type, Dict, List, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Optional,
+    Type,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Iterable,
+    Iterator,
+)
 
 from edmlib import (
     MixedValuesList,
@@ -14,19 +27,27 @@ from edmlib import (
     SVCS_Service,
 )
 from edmlib.edm import EDM_Record, EDM_ProvidedCHO, Lit, Ref
+from lxml import etree
 from lxml.etree import _Element
 
 from .utilities import (
     METS_MODS_NAMESPACES,
+    METS_PARSER_OPTIONS,
     join_tag_texts_xpath,
     literal_list_from_xpath,
     xpath_first_match,
     mods_ns,
+    mets_ns,
+    qualified_name,
     uri_list_from_xpath,
     ModsNameResultsType,
+    ModsSubjectResultsType,
+    MetsSectionsType,
     first_literal_from_xpath,
     CONTEXT_DICT_TYPE,
     context_dict_to_edm_record_dict,
+    evaluate_xpath,
+    XPathQueryType,
 )
 
 logger = logging.getLogger("mets-to-edm")
@@ -34,8 +55,210 @@ logger = logging.getLogger("mets-to-edm")
 
 XSL_FILE = os.path.join(os.path.dirname(__file__), "MODSMETS2EDM.xsl")
 
+# constant values shared by all records, literals are not modified after validation
+_EDM_TYPE_TEXT: Final[Lit] = Lit(value="TEXT")
+
+
+@functools.lru_cache(maxsize=4096)
+def _lit(value: str, lang: Optional[str] = None) -> Lit:
+    # shared literals for the closed vocabularies that repeat across records (languages, div types, providers),
+    # the values must be plain strings: lxml smart strings would keep their whole document alive in the cache
+    return Lit(value=value, lang=lang)
+
+
+def _xpath(query: str) -> etree.XPath:
+    return etree.XPath(query, namespaces=METS_MODS_NAMESPACES)
+
+
+# XPath expressions evaluated for every record, compiled once at import time
+# relative to the given element, e.g. the OAI-PMH record wrapping the mets:mets element
+_XP_METS_ROOT = _xpath("(descendant::mets:mets)[1]")
+# relative to the dmd_sec, so records that are not the first mets:mets of a document use their own LABEL
+_XP_METS_LABEL = _xpath("ancestor::mets:mets[1]/@LABEL")
+_XP_MAIN_DIV = _xpath(
+    "mets:structMap[@TYPE='LOGICAL']//mets:div[@DMDID and not(mets:mptr)]"
+)
+_XP_FALLBACK_MAIN_DIV = _xpath("(mets:structMap[@TYPE='LOGICAL']//mets:div[@DMDID])[1]")
+# the IDs are passed as XPath variables, so the expressions don't have to be recompiled for every ID
+_XP_FILE_ID_BY_GRP = _xpath("mets:fptr[contains(@FILEID,$file_grp)]/@FILEID")
+_XP_HOST_RELATED_ITEM = _xpath("mods:relatedItem[@type='host']")
+_XP_HOST_DIV = _xpath("ancestor::mets:div[@DMDID][1]")
+# titles
+_XP_NON_SORT = _xpath("mods:nonSort")
+_XP_TITLE = _xpath("mods:title")
+_XP_SUB_TITLE = _xpath("mods:subTitle")
+_XP_PART_NUMBER = _xpath("mods:partNumber")
+_XP_PART_NAME = _xpath("mods:partName")
+_XP_TITLE_INFOS = _xpath("mods:titleInfo")
+# descriptive metadata
+_XP_NOTES = _xpath("mods:note")
+# the subelements of all mods:subject elements in document order, comments and processing instructions are skipped
+_XP_SUBJECT_SUBELEMENTS = _xpath("mods:subject/*")
+_XP_ABSTRACTS = _xpath("mods:abstract")
+_XP_RECORD_IDENTIFIERS = _xpath("mods:recordInfo/mods:recordIdentifier")
+_XP_IDENTIFIERS = _xpath("mods:identifier")
+_XP_INTRANDA_SUBJECT_PERSONS = _xpath(
+    "mods:extension/intranda:intranda/intranda:subjectPerson"
+)
+_XP_INTRANDA_TOPICS = _xpath("mods:extension/intranda:Topic")
+_XP_INTRANDA_OBJECT_TYPES = _xpath("mods:extension/intranda:ObjectType")
+_XP_TECHNIQUES = _xpath("mods:physicalDescription/mods:form[@type='technique']")
+_XP_GENRES = _xpath("mods:genre")
+_XP_INTRANDA_TOPIC_PERIODS = _xpath("mods:extension/intranda:TopicPeriod")
+_XP_INTRANDA_TOPIC_ROOMS = _xpath("mods:extension/intranda:TopicRoom")
+_XP_INTRANDA_PLACES = _xpath("mods:extension/intranda:place")
+_XP_ORIGIN_PLACES = _xpath("mods:originInfo/mods:place/mods:placeTerm[@type='text']")
+_XP_MEDIUMS = _xpath(
+    "mods:physicalDescription/mods:form[not(@type='technique') and not(@type='dimensions')]"
+)
+_XP_EXTENTS = _xpath("mods:physicalDescription/mods:extent")
+_XP_DIMENSIONS = _xpath("mods:physicalDescription/mods:form[@type='dimensions']")
+_XP_LANGUAGE_TERMS = etree.XPath(
+    "mods:language/mods:languageTerm/text()",
+    namespaces=METS_MODS_NAMESPACES,
+    smart_strings=False,
+)
+_XP_DATES_ISSUED = _xpath("mods:originInfo/mods:dateIssued")
+_XP_DATES_CREATED = _xpath("mods:originInfo/mods:dateCreated")
+_XP_PUBLISHERS = _xpath("mods:originInfo/mods:publisher")
+_XP_PHYSICAL_LOCATION = _xpath("mods:location[1]/mods:physicalLocation[1]")
+_XP_SHELF_LOCATORS = _xpath("mods:location[1]/mods:shelfLocator")
+# rights
+_XP_ACCESS_CONDITION_HREF = _xpath("mods:accessCondition[@xlink:href][1]/@xlink:href")
+_XP_ACCESS_CONDITION_VALUE_URI = _xpath(
+    "mods:accessCondition[@mods:valueURI][1]/@mods:valueURI"
+)
+_XP_ACCESS_CONDITIONS = _xpath("mods:accessCondition[@type!='hide']")
+# files and web resources
+_XP_PAGE_DIVS = _xpath("mets:div[@TYPE='page']")
+_XP_FRONTIMAGE_FILE_ID = _xpath("mets:fptr[contains(@FILEID,'FRONTIMAGE')]/@FILEID")
+_XP_TEASER_FILE_ID = _xpath("mets:fptr[contains(@FILEID,'TEASER')]/@FILEID")
+_XP_BANNER_FILE_ID = _xpath("mets:fileGrp[@USE='DEFAULT']/mets:file[@USE='banner']/@ID")
+_XP_PRESENTATION_LINKS = _xpath(
+    "mets:digiprovMD/mets:mdWrap/mets:xmlData/dv:links/dv:presentation"
+)
+
+
+# qualified tag names of the mods:subject subelements, built once instead of on every comparison
+_TAG_TOPIC = mods_ns("topic")
+_TAG_GEOGRAPHIC = mods_ns("geographic")
+_TAG_TEMPORAL = mods_ns("temporal")
+_TAG_TITLE_INFO = mods_ns("titleInfo")
+_TAG_NAME = mods_ns("name")
+_TAG_GENRE = mods_ns("genre")
+# qualified tag names of mods:part and its subelements used for title suffixes
+_TAG_PART = mods_ns("part")
+_TAG_DETAIL = mods_ns("detail")
+_TAG_NUMBER = mods_ns("number")
+_TAG_DATE = mods_ns("date")
+# qualified tag names of the mods:name subelements
+_TAG_DISPLAY_FORM = mods_ns("displayForm")
+_TAG_NAME_PART = mods_ns("namePart")
+_TAG_ALTERNATIVE_NAME = mods_ns("alternativeName")
+_PATH_ROLE_TERMS = mods_ns("role") + "/" + mods_ns("roleTerm")
+
+# qualified names of the mets sections and the paths below them, used by find() without prefix resolution
+_TAG_METS = mets_ns("mets")
+_TAG_DMD_SEC = mets_ns("dmdSec")
+_TAG_AMD_SEC = mets_ns("amdSec")
+_TAG_STRUCT_MAP = mets_ns("structMap")
+_TAG_FILE_SEC = mets_ns("fileSec")
+_TAG_DIV = mets_ns("div")
+_PATH_MODS_OF_DMD_SEC = "/".join(
+    (mets_ns("mdWrap"), mets_ns("xmlData"), mods_ns("mods"))
+)
+_TAG_FLOCAT = mets_ns("FLocat")
+_ATTR_XLINK_HREF = qualified_name("xlink", "href")
+_PATH_OWNER = "/".join(
+    (
+        mets_ns("rightsMD"),
+        mets_ns("mdWrap"),
+        mets_ns("xmlData"),
+        qualified_name("dv", "rights"),
+        qualified_name("dv", "owner"),
+    )
+)
+_PATH_IIIF_MANIFEST = "/".join(
+    (
+        mets_ns("digiprovMD"),
+        mets_ns("mdWrap"),
+        mets_ns("xmlData"),
+        qualified_name("dv", "links"),
+        qualified_name("dv", "iiif"),
+    )
+)
+
+
+def index_mets_sections(record: _Element) -> MetsSectionsType:
+    """Collects the top-level sections of a mets:mets element in a single pass over its children"""
+    sections = {"dmdSec": {}, "amdSec": {}, "structMap": {}, "fileSec": None}
+    for child in record:
+        tag = child.tag
+        if tag == _TAG_DMD_SEC or tag == _TAG_AMD_SEC:
+            # sections without ID can't be referenced
+            section_id = child.get("ID")
+            if section_id is not None:
+                sections["dmdSec" if tag == _TAG_DMD_SEC else "amdSec"].setdefault(
+                    section_id, child
+                )
+        elif tag == _TAG_STRUCT_MAP:
+            struct_map_type = child.get("TYPE")
+            if struct_map_type is not None:
+                sections["structMap"].setdefault(struct_map_type, child)
+        elif tag == _TAG_FILE_SEC and sections["fileSec"] is None:
+            sections["fileSec"] = child
+    return sections
+
+
+def index_file_urls(file_sec: _Element) -> Dict[str, str]:
+    """Maps the IDs of all mets:file elements of a fileSec to their first URL mets:FLocat"""
+    file_urls = {}
+    # a single walk over the FLocat elements, the file ID is read from the parent of the first URL location
+    for flocat in file_sec.iter(_TAG_FLOCAT):
+        if flocat.get("LOCTYPE") == "URL":
+            href = flocat.get(_ATTR_XLINK_HREF)
+            if href:
+                file_urls.setdefault(flocat.getparent().get("ID"), href)
+    return file_urls
+
+
+def _http_scheme(uri: str) -> str:
+    # rights statements and licenses are identified by their http:// URIs in EDM
+    return "http://" + uri[8:] if uri.startswith("https://") else uri
+
+
+def _concat(*value_lists: List[Any]) -> List[Any]:
+    # a single list is extended in place instead of copying the intermediate results of chained `+`
+    values = []
+    for value_list in value_lists:
+        values.extend(value_list)
+    return values
+
+
+class _RoleSets(NamedTuple):
+    ignore: FrozenSet[str]
+    creator: FrozenSet[str]
+    rights: FrozenSet[str]
+    publisher: FrozenSet[str]
+    subject: FrozenSet[str]
+    other: FrozenSet[str]
+
+
+@functools.lru_cache(maxsize=None)
+def _role_sets(mapper_class: type) -> _RoleSets:
+    # the role lists of a mapper class are converted to sets once, when the first mods:name is mapped
+    return _RoleSets(
+        ignore=frozenset(mapper_class.IGNORE_ROLES),
+        creator=frozenset(mapper_class.CREATOR_ROLES),
+        rights=frozenset(mapper_class.RIGHTS_ROLES),
+        publisher=frozenset(mapper_class.PUBLISHER_ROLES),
+        subject=frozenset(mapper_class.SUBJECT_ROLES),
+        other=frozenset(mapper_class.OTHER_ROLES),
+    )
+
 
 def retry_with_host_data(func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
     def wrapper_retry_with_host_data(
         cls: Type["MetsToEdmMapper"],
         dmd_sec: _Element,
@@ -43,7 +266,8 @@ def retry_with_host_data(func: Callable[..., Any]) -> Callable[..., Any]:
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        values = func(cls, dmd_sec=dmd_sec, *args, **kwargs)
+        # dmd_sec is passed positionally, so no keyword arguments dict has to be built for the common case
+        values = func(cls, dmd_sec, *args, **kwargs)
 
         # Check if original result was already valid
         if isinstance(values, dict):
@@ -54,7 +278,7 @@ def retry_with_host_data(func: Callable[..., Any]) -> Callable[..., Any]:
 
         # Retry with host dmd_sec
         if host_dmd_sec is not None:
-            return func(cls, dmd_sec=host_dmd_sec, *args, **kwargs)
+            return func(cls, host_dmd_sec, *args, **kwargs)
 
         return values
 
@@ -63,18 +287,19 @@ def retry_with_host_data(func: Callable[..., Any]) -> Callable[..., Any]:
 
 class MetsToEdmMapper:
     SUBJECT_SUBELEMENTS_MAPPING = {
-        mods_ns("topic"): ("dc_subject", SKOS_Concept),
-        mods_ns("geographic"): ("dcterms_spatial", EDM_Place),
-        mods_ns("temporal"): ("dcterms_temporal", EDM_TimeSpan),
-        mods_ns("titleInfo"): ("dc_subject", SKOS_Concept),
-        mods_ns("name"): ("dc_subject", EDM_Agent),
-        mods_ns("genre"): ("dc_type", SKOS_Concept),
+        _TAG_TOPIC: ("dc_subject", SKOS_Concept),
+        _TAG_GEOGRAPHIC: ("dcterms_spatial", EDM_Place),
+        _TAG_TEMPORAL: ("dcterms_temporal", EDM_TimeSpan),
+        _TAG_TITLE_INFO: ("dc_subject", SKOS_Concept),
+        _TAG_NAME: ("dc_subject", EDM_Agent),
+        _TAG_GENRE: ("dc_type", SKOS_Concept),
         mods_ns("cartographics"): (None, None),
         mods_ns("hierarchicalGeographic"): (None, None),
         mods_ns("geographicCode"): (None, None),
         mods_ns("occupation"): (None, None),
         # TODO: maybe also support hierarchicalGeographic, cartographics, geographicCode, occupation
     }
+    # MARC relator codes, subclasses can extend the lists, e.g. CREATOR_ROLES = MetsToEdmMapper.CREATOR_ROLES + ["ill"]
     CREATOR_ROLES = ["aut", "cmp", "art", "pht", "edt"]
     RIGHTS_ROLES = ["cph", "cpc"]
     PUBLISHER_ROLES = ["pbl", "isb"]
@@ -94,6 +319,8 @@ class MetsToEdmMapper:
         "lyr",
     ]
     IGNORE_ROLES = ["his"]
+    # set to False in a subclass to skip mapping dc:description entirely
+    DESCRIPTIONS_ENABLED: bool = True
 
     # @classmethod
     # def get_file_from_logical_div(cls,record: _Element, logical_div: _Element):
@@ -101,10 +328,7 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_main_structmap_div(cls, record: _Element) -> _Element:
-        possible_divs = record.xpath(
-            "mets:structMap[@TYPE='LOGICAL']//mets:div[@DMDID and not(mets:mptr)]",
-            namespaces=METS_MODS_NAMESPACES,
-        )
+        possible_divs = _XP_MAIN_DIV(record)
         for div in possible_divs:
             # if div.get("TYPE") and div.get("TYPE").lower() in [
             #     "article",
@@ -117,64 +341,80 @@ class MetsToEdmMapper:
             # ]:
             return div
         # Else
-        div = record.xpath(
-            "(mets:structMap[@TYPE='LOGICAL']//mets:div[@DMDID])[1]",
-            namespaces=METS_MODS_NAMESPACES,
-        )
+        div = _XP_FALLBACK_MAIN_DIV(record)
         assert len(div) > 0, "Could not find starting div in structmap"
         return div[0]
 
     @classmethod
-    def get_mods_part(cls, record: _Element, dmdid: str) -> _Element:
-        dmd_secs = record.xpath(
-            f"mets:dmdSec[@ID='{dmdid}']/mets:mdWrap/mets:xmlData/mods:mods[1]",
-            namespaces=METS_MODS_NAMESPACES,
-        )
-        assert len(dmd_secs) == 1, f"dmdsec not found or multiples for id {dmdid}"
-        return dmd_secs[0]
+    def get_mods_part(
+        cls,
+        record: _Element,
+        dmdid: str,
+        sections: Optional[MetsSectionsType] = None,
+    ) -> _Element:
+        if dmdid is None:
+            raise ValueError("no dmdsec id given")
+        if sections is None:
+            sections = index_mets_sections(record)
+        dmd_sec = sections["dmdSec"].get(dmdid)
+        mods = dmd_sec.find(_PATH_MODS_OF_DMD_SEC) if dmd_sec is not None else None
+        if mods is None:
+            raise ValueError(f"dmdsec with mods not found for id {dmdid}")
+        return mods
 
     @classmethod
     def get_host_dmd_sec(
-        cls, record: _Element, dmd_sec: _Element, logical_main_div: _Element
+        cls,
+        record: _Element,
+        dmd_sec: _Element,
+        logical_main_div: _Element,
+        sections: Optional[MetsSectionsType] = None,
     ) -> Optional[_Element]:
         host_dmd_sec = None
-        if possible_hosts := dmd_sec.xpath(
-            "mods:relatedItem[@type='host']", namespaces=METS_MODS_NAMESPACES
-        ):
+        if possible_hosts := _XP_HOST_RELATED_ITEM(dmd_sec):
             host_dmd_sec = possible_hosts[0]
-        elif logical_host_div := logical_main_div.xpath(
-            "ancestor::mets:div[@DMDID][1]", namespaces=METS_MODS_NAMESPACES
-        ):
+        elif logical_host_div := _XP_HOST_DIV(logical_main_div):
             host_dmd_sec = cls.get_mods_part(
-                record, dmdid=logical_host_div[0].get("DMDID")
+                record, dmdid=logical_host_div[0].get("DMDID"), sections=sections
             )
         return host_dmd_sec
 
     @classmethod
-    def get_amd_part(cls, record: _Element, amdid: str) -> list[_Element]:
-        amd_secs = record.xpath(
-            f"mets:amdSec[@ID='{amdid}'][1]",
-            namespaces=METS_MODS_NAMESPACES,
-        )
-        assert len(amd_secs) == 1, f"amdsec not found or multiples for id {amdid}"
-        return amd_secs[0]
+    def get_amd_part(
+        cls,
+        record: _Element,
+        amdid: str,
+        sections: Optional[MetsSectionsType] = None,
+    ) -> _Element:
+        if amdid is None:
+            raise ValueError("no amdsec id given")
+        if sections is None:
+            sections = index_mets_sections(record)
+        amd_sec = sections["amdSec"].get(amdid)
+        if amd_sec is None:
+            raise ValueError(f"amdsec not found for id {amdid}")
+        return amd_sec
 
     @classmethod
     def process_title_tag(cls, title_element: _Element) -> tuple[str, Lit]:
         # TODO: consider whitespace handling and separators
-        title = join_tag_texts_xpath(title_element, "mods:nonSort")
-        title += join_tag_texts_xpath(title_element, "mods:title")
-        subtitle = join_tag_texts_xpath(title_element, "mods:subTitle", separator="; ")
+        # the parts are collected with their separators and joined once
+        title_parts = [
+            join_tag_texts_xpath(title_element, _XP_NON_SORT),
+            join_tag_texts_xpath(title_element, _XP_TITLE),
+        ]
+        subtitle = join_tag_texts_xpath(title_element, _XP_SUB_TITLE, separator="; ")
         if subtitle:
-            title += ": " + subtitle
+            title_parts += (": ", subtitle)
         partnumber = join_tag_texts_xpath(
-            title_element, "mods:partNumber", separator=", "
+            title_element, _XP_PART_NUMBER, separator=", "
         )
         if partnumber:
-            title += " " + partnumber
-        partname = join_tag_texts_xpath(title_element, "mods:partName", separator=", ")
+            title_parts += (" ", partnumber)
+        partname = join_tag_texts_xpath(title_element, _XP_PART_NAME, separator=", ")
         if partname:
-            title += ": " + partname
+            title_parts += (": ", partname)
+        title = "".join(title_parts)
 
         # TODO: languages: either from attrs lang/xml:lang on titleInfo or subtags, or from document language
 
@@ -183,6 +423,14 @@ class MetsToEdmMapper:
         else:
             return ("dc_title", Lit(value=title))
 
+    @classmethod
+    def collect_title_infos(cls, dmd_sec: _Element) -> Dict[str, List[Lit]]:
+        title_properties = {"dcterms_alternative": [], "dc_title": []}
+        for title_info in _XP_TITLE_INFOS(dmd_sec):
+            title_type, title = cls.process_title_tag(title_info)
+            title_properties[title_type].append(title)
+        return title_properties
+
     @classmethod
     def get_titles(
         cls,
@@ -190,30 +438,33 @@ class MetsToEdmMapper:
         host_dmd_sec: Optional[_Element] = None,
         fallback_to_mets_label: bool = True,
     ) -> Dict[str, List[Lit]]:
-        title_properties = {"dcterms_alternative": [], "dc_title": []}
-        titles = dmd_sec.xpath("mods:titleInfo", namespaces=METS_MODS_NAMESPACES)
-        for title_info in titles:
-            title_type, title = cls.process_title_tag(title_info)
-            title_properties[title_type].append(title)
+        title_properties = cls.collect_title_infos(dmd_sec)
 
         # If no title try to create it from host volume and part
         volume = None
         issue = None
         others = []
-        detail_numbers = dmd_sec.xpath(
-            "mods:part/mods:detail[mods:number]",
-            namespaces=METS_MODS_NAMESPACES,
-        )
-        for detail_number in detail_numbers:
-            number = detail_number.find(
-                "mods:number", namespaces=METS_MODS_NAMESPACES
-            ).text
-            if detail_number.get("type") == "volume":
-                volume = number
-            elif detail_number.get("type") == "issue":
-                issue = number
-            else:
-                others.append(number)
+        date_suffix = None
+        # single pass over the mods:part elements collecting the numbered details and the first date
+        for part in dmd_sec.iterchildren(_TAG_PART):
+            first_date = True
+            for part_child in part:
+                if part_child.tag == _TAG_DETAIL:
+                    number = part_child.find(_TAG_NUMBER)
+                    if number is None:
+                        continue
+                    detail_type = part_child.get("type")
+                    if detail_type == "volume":
+                        volume = number.text
+                    elif detail_type == "issue":
+                        issue = number.text
+                    else:
+                        others.append(number.text)
+                elif part_child.tag == _TAG_DATE and first_date:
+                    # only the first mods:date of every part is considered
+                    first_date = False
+                    if date_suffix is None:
+                        date_suffix = part_child.text
 
         if volume and issue:
             suffix = f"{volume}/{issue}"
@@ -225,14 +476,13 @@ class MetsToEdmMapper:
         #    namespaces=METS_MODS_NAMESPACES,
         # )
         if not suffix:
-            date_suffix = dmd_sec.xpath(
-                "mods:part/mods:date[1]/text()", namespaces=METS_MODS_NAMESPACES
-            )
-            suffix = date_suffix[0] if date_suffix else None
+            suffix = date_suffix
 
         if suffix and host_dmd_sec is not None:
-            for host_title_type, host_titles in cls.get_titles(
-                host_dmd_sec, fallback_to_mets_label=False
+            # only the titleInfos of the host are used: without a host of its own and without the mets:mets/@LABEL
+            # fallback, get_titles would not add anything for the mods:part of the host
+            for host_title_type, host_titles in cls.collect_title_infos(
+                host_dmd_sec
             ).items():
                 for host_title in host_titles:
                     title_properties[host_title_type].append(
@@ -245,13 +495,10 @@ class MetsToEdmMapper:
             and fallback_to_mets_label
         ):
             # if still no title try the mets:mets/@LABEL as last resort
-            mets_label = dmd_sec.xpath(
-                "//mets:mets/@LABEL", namespaces=METS_MODS_NAMESPACES
-            )
-            if suffix and mets_label:
-                mets_label = mets_label[0]
+            mets_label = _XP_METS_LABEL(dmd_sec) if suffix else None
+            if mets_label:
                 title_properties["dc_title"].append(
-                    Lit(value=mets_label + " " + suffix)
+                    Lit(value=mets_label[0] + " " + suffix)
                 )
         return title_properties
 
@@ -267,77 +514,83 @@ class MetsToEdmMapper:
             return output
 
         return literal_list_from_xpath(
-            dmd_sec, "mods:note", string_extract_function=note_string_extract
-        ) + literal_list_from_xpath(dmd_sec, "mods:abstract")
+            dmd_sec, _XP_NOTES, string_extract_function=note_string_extract
+        ) + literal_list_from_xpath(dmd_sec, _XP_ABSTRACTS)
 
     @classmethod
     def get_identifiers(cls, dmd_sec: _Element) -> List[Lit]:
         return literal_list_from_xpath(
-            dmd_sec, "mods:recordInfo/mods:recordIdentifier"
-        ) + literal_list_from_xpath(dmd_sec, "mods:identifier")
+            dmd_sec, _XP_RECORD_IDENTIFIERS
+        ) + literal_list_from_xpath(dmd_sec, _XP_IDENTIFIERS)
 
     @classmethod
     def get_edm_type(
         cls, dmd_sec: _Element, logical_main_div: Optional[_Element] = None
     ) -> Lit:
-        return Lit(value="TEXT")
+        return _EDM_TYPE_TEXT
 
     @classmethod
     def parse_mods_subjects(
         cls, dmd_sec: _Element, context_objects: CONTEXT_DICT_TYPE
-    ) -> Dict[str, List[Union[Lit, Ref]]]:
-        subjects = dmd_sec.findall("mods:subject", namespaces=METS_MODS_NAMESPACES)
-        edm_values: dict[str, list[Lit | Ref]] = defaultdict(list)
-        for subject in subjects:
-            for subject_subelement in subject:
-                edm_property, context_class = cls.SUBJECT_SUBELEMENTS_MAPPING[
-                    subject_subelement.tag
-                ]
-                if edm_property is None:
-                    logger.warning(
-                        f"unimplemented mods:subject subelement {subject_subelement.tag}"
-                    )
+    ) -> ModsSubjectResultsType:
+        # process_record reads each of the default properties, subclasses may map subelements to further ones
+        edm_values = {
+            "dc_subject": [],
+            "dcterms_spatial": [],
+            "dcterms_temporal": [],
+            "dc_type": [],
+        }
+        subject_mapping = cls.SUBJECT_SUBELEMENTS_MAPPING
+        for edm_property, _ in subject_mapping.values():
+            if edm_property is not None:
+                edm_values.setdefault(edm_property, [])
+        # a single query over all subjects, the subelements are routed by their tag
+        for subject_subelement in _XP_SUBJECT_SUBELEMENTS(dmd_sec):
+            tag = subject_subelement.tag
+            edm_property, context_class = subject_mapping.get(tag, (None, None))
+            if edm_property is None:
+                logger.warning(f"unimplemented mods:subject subelement {tag}")
+                continue
+            if tag == _TAG_TITLE_INFO:
+                pref_label = cls.process_title_tag(subject_subelement)[1]
+            elif tag == _TAG_NAME:
+                person = cls.parse_mods_name(subject_subelement)
+                if not person:
+                    continue
+                elif isinstance(person, EDM_Agent):
+                    context_objects[person.id.value] = person
+                    edm_values[edm_property].append(person.id)
                     continue
-                if subject_subelement.tag == mods_ns("titleInfo"):
-                    pref_label = cls.process_title_tag(subject_subelement)[1]
-                elif subject_subelement.tag == mods_ns("name"):
-                    person = cls.parse_mods_name(subject_subelement)
-                    if not person:
-                        continue
-                    elif isinstance(person, EDM_Agent):
-                        context_objects[person.id.value] = person
-                        edm_values[edm_property].append(person.id)
-                        continue
-                    else:
-                        edm_values[edm_property].append(person)
-                        continue
                 else:
-                    pref_label = Lit(value=subject_subelement.text)
+                    edm_values[edm_property].append(person)
+                    continue
+            else:
+                pref_label = Lit(value=subject_subelement.text)
 
-                if subject_subelement.get("valueURI"):
-                    context_object = context_class(
-                        id=Ref(value=subject_subelement.get("valueURI")),
-                        skos_prefLabel=[pref_label],
-                    )
-                    context_objects[context_object.id.value] = context_object
-                    edm_values[edm_property].append(context_object.id)
-                else:
-                    edm_values[edm_property].append(pref_label)
+            if subject_subelement.get("valueURI"):
+                context_object = context_class(
+                    id=Ref(value=subject_subelement.get("valueURI")),
+                    skos_prefLabel=[pref_label],
+                )
+                context_objects[context_object.id.value] = context_object
+                edm_values[edm_property].append(context_object.id)
+            else:
+                edm_values[edm_property].append(pref_label)
         return edm_values
 
     @classmethod
     def get_subjects(cls, dmd_sec: _Element) -> MixedValuesList:
         # intranda extension:
         return literal_list_from_xpath(
-            dmd_sec, "mods:extension/intranda:intranda/intranda:subjectPerson"
-        ) + literal_list_from_xpath(dmd_sec, "mods:extension/intranda:Topic")
+            dmd_sec, _XP_INTRANDA_SUBJECT_PERSONS
+        ) + literal_list_from_xpath(dmd_sec, _XP_INTRANDA_TOPICS)
 
     @classmethod
     def parse_logical_main_div_type(
         cls, logical_main_div: Optional[_Element] = None
     ) -> List[Lit]:
         if logical_main_div is not None and logical_main_div.get("TYPE"):
-            type_from_div = [Lit(value=logical_main_div.get("TYPE"))]
+            type_from_div = [_lit(logical_main_div.get("TYPE"))]
             return type_from_div
         else:
             return []
@@ -348,68 +601,56 @@ class MetsToEdmMapper:
     ) -> MixedValuesList:
         # intranda extension:
         return (
-            literal_list_from_xpath(dmd_sec, "mods:extension/intranda:ObjectType")
-            + literal_list_from_xpath(
-                dmd_sec, "mods:physicalDescription/mods:form[@type='technique']"
-            )
-            + literal_list_from_xpath(dmd_sec, "mods:genre")
+            literal_list_from_xpath(dmd_sec, _XP_INTRANDA_OBJECT_TYPES)
+            + literal_list_from_xpath(dmd_sec, _XP_TECHNIQUES)
+            + literal_list_from_xpath(dmd_sec, _XP_GENRES)
             + cls.parse_logical_main_div_type(logical_main_div)
         )
 
     @classmethod
     def get_temporals(cls, dmd_sec: _Element) -> MixedValuesList:
         # intranda extension:
-        return literal_list_from_xpath(dmd_sec, "mods:extension/intranda:TopicPeriod")
+        return literal_list_from_xpath(dmd_sec, _XP_INTRANDA_TOPIC_PERIODS)
 
     @classmethod
     def get_spatials(cls, dmd_sec: _Element) -> MixedValuesList:
         # intranda extension:
-        intranda_spatials = literal_list_from_xpath(
-            dmd_sec, "mods:extension/intranda:TopicRoom"
-        )
-        intranda_places = literal_list_from_xpath(
-            dmd_sec, "mods:extension/intranda:place"
-        )
-        origin_places = literal_list_from_xpath(
-            dmd_sec, "mods:originInfo/mods:place/mods:placeTerm[@type='text']"
-        )
+        intranda_spatials = literal_list_from_xpath(dmd_sec, _XP_INTRANDA_TOPIC_ROOMS)
+        intranda_places = literal_list_from_xpath(dmd_sec, _XP_INTRANDA_PLACES)
+        origin_places = literal_list_from_xpath(dmd_sec, _XP_ORIGIN_PLACES)
         return intranda_spatials + intranda_places + origin_places
 
     @classmethod
     def get_mediums(cls, dmd_sec: _Element) -> MixedValuesList:
         return literal_list_from_xpath(
-            dmd_sec,
-            "mods:physicalDescription/mods:form[not(@type='technique') and not(@type='dimensions')]",
+            dmd_sec, _XP_MEDIUMS
         )  # TODO: check if there is a valueURI to create vocabulary references
 
     @classmethod
     def get_extent(cls, dmd_sec: _Element) -> MixedValuesList:
-        return literal_list_from_xpath(
-            dmd_sec, "mods:physicalDescription/mods:extent"
-        ) + literal_list_from_xpath(
-            dmd_sec, "mods:physicalDescription/mods:form[@type='dimensions']"
+        return literal_list_from_xpath(dmd_sec, _XP_EXTENTS) + literal_list_from_xpath(
+            dmd_sec, _XP_DIMENSIONS
         )
 
     @classmethod
     def get_languages(cls, dmd_sec: _Element) -> List[str]:
-        langs = dmd_sec.xpath(
-            "mods:language/mods:languageTerm/text()", namespaces=METS_MODS_NAMESPACES
-        )
+        langs = _XP_LANGUAGE_TERMS(dmd_sec)
         # TODO: convert to ISO language codes
         return langs
 
     @classmethod
     def parse_mods_date(
-        cls, dmd_sec: _Element, date_element_name: str
+        cls, dmd_sec: _Element, date_element_name: XPathQueryType
     ) -> Optional[List[Lit]]:
-        dates = dmd_sec.xpath(date_element_name, namespaces=METS_MODS_NAMESPACES)
+        dates = evaluate_xpath(dmd_sec, date_element_name)
         start = ""
         end = ""
         other = ""
         for date in dates:
-            if date.get("point") == "start":
+            point = date.get("point")
+            if point == "start":
                 start = date.text
-            elif date.get("point") == "end":
+            elif point == "end":
                 end = date.text
             else:
                 if date.get("keyDate") == "yes" or not other:
@@ -426,46 +667,53 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_issued(cls, dmd_sec: _Element) -> Optional[List[Lit]]:
-        return cls.parse_mods_date(dmd_sec, "mods:originInfo/mods:dateIssued")
+        return cls.parse_mods_date(dmd_sec, _XP_DATES_ISSUED)
 
     @classmethod
     def get_created(cls, dmd_sec: _Element) -> Optional[List[Lit]]:
-        return cls.parse_mods_date(dmd_sec, "mods:originInfo/mods:dateCreated")
+        return cls.parse_mods_date(dmd_sec, _XP_DATES_CREATED)
 
     @classmethod
     @retry_with_host_data
     def get_publishers(
         cls, dmd_sec: _Element, host_dmd_sec: Optional[_Element] = None
     ) -> List[Lit]:
-        return literal_list_from_xpath(dmd_sec, "mods:originInfo/mods:publisher")
+        return literal_list_from_xpath(dmd_sec, _XP_PUBLISHERS)
 
     @classmethod
     def get_full_name_from_name_tag(cls, name_tag: _Element) -> str:
-        # first try displayForm
-        display_form = name_tag.find(
-            "mods:displayForm", namespaces=METS_MODS_NAMESPACES
-        )
-        if display_form is not None and display_form.text:
-            return display_form.text
-
-        # otherwise join nameparts based on type
-        given_name = join_tag_texts_xpath(
-            name_tag, "mods:namePart[@type='given']", separator=" "
-        )
-        family_name = join_tag_texts_xpath(
-            name_tag, "mods:namePart[@type='family']", separator=" "
-        )
-        address = join_tag_texts_xpath(
-            name_tag, "mods:namePart[@type='termsOfAddress']", separator=" "
-        )
-        name = (" ".join([given_name, family_name, address])).strip()
+        # single pass over the subelements: the first displayForm is used if it has a text,
+        # otherwise the nameparts are joined based on type
+        display_form_seen = False
+        given_names = []
+        family_names = []
+        addresses = []
+        untyped_name_parts = []
+        for child in name_tag:
+            tag = child.tag
+            if tag == _TAG_DISPLAY_FORM:
+                if not display_form_seen:
+                    display_form_seen = True
+                    if child.text:
+                        return child.text
+            elif tag == _TAG_NAME_PART and child.text:
+                name_part_type = child.get("type")
+                if name_part_type is None:
+                    untyped_name_parts.append(child.text)
+                elif name_part_type == "given":
+                    given_names.append(child.text)
+                elif name_part_type == "family":
+                    family_names.append(child.text)
+                elif name_part_type == "termsOfAddress":
+                    addresses.append(child.text)
+
+        # only non-empty parts are joined, so missing parts don't leave double spaces
+        name = " ".join(given_names + family_names + addresses).strip()
         if name:
             return name
 
         # otherwise use nameparts without type
-        return join_tag_texts_xpath(
-            name_tag, "mods:namePart[not(@type)]", separator=" "
-        )
+        return " ".join(untyped_name_parts)
 
     @classmethod
     def parse_mods_name(cls, name_tag: _Element) -> Lit | Ref | EDM_Agent | None:
@@ -480,9 +728,7 @@ class MetsToEdmMapper:
         # then do alternativeNames as well
         alt_names = [
             Lit(value=alt_name)
-            for alt_name_tag in name_tag.findall(
-                "mods:alternativeName", namespaces=METS_MODS_NAMESPACES
-            )
+            for alt_name_tag in name_tag.iterchildren(_TAG_ALTERNATIVE_NAME)
             if (alt_name := cls.get_full_name_from_name_tag(alt_name_tag))
         ]
         # TODO: maybe also support altRepGroup in the future
@@ -501,19 +747,20 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_edm_property_for_roles(cls, roles: List[str]) -> Optional[str]:
+        role_sets = _role_sets(cls)
         edm_property = "dc_contributor"
         for role_entry in roles:
-            if role_entry in cls.IGNORE_ROLES:
+            if role_entry in role_sets.ignore:
                 return None
-            elif role_entry in cls.CREATOR_ROLES:
+            elif role_entry in role_sets.creator:
                 return "dc_creator"
-            elif role_entry in cls.RIGHTS_ROLES:
+            elif role_entry in role_sets.rights:
                 edm_property = "dc_rights"
-            elif role_entry in cls.PUBLISHER_ROLES:
+            elif role_entry in role_sets.publisher:
                 edm_property = "dc_publisher"
-            elif role_entry in cls.SUBJECT_ROLES:
+            elif role_entry in role_sets.subject:
                 edm_property = "dc_subject"
-            elif role_entry not in cls.OTHER_ROLES:
+            elif role_entry not in role_sets.other:
                 logger.warning(
                     f'Unknown Role: "{role_entry}", falling back to contributor'
                 )
@@ -532,7 +779,7 @@ class MetsToEdmMapper:
             "dc_subject": [],
             "dc_rights": [],
         }
-        for name_tag in dmd_sec.findall("mods:name", namespaces=METS_MODS_NAMESPACES):
+        for name_tag in dmd_sec.iterchildren(_TAG_NAME):
             literal_or_agent = cls.parse_mods_name(name_tag)
             if not literal_or_agent:
                 continue
@@ -541,12 +788,7 @@ class MetsToEdmMapper:
                 context_objects[literal_or_agent.id.value] = literal_or_agent
                 name_value = literal_or_agent.id
 
-            roles = [
-                r.text
-                for r in name_tag.findall(
-                    "mods:role/mods:roleTerm", namespaces=METS_MODS_NAMESPACES
-                )
-            ]
+            roles = [r.text for r in name_tag.iterfind(_PATH_ROLE_TERMS)]
             if "fmo" in roles:
                 former_owner_value = (
                     literal_or_agent.skos_prefLabel[0].value
@@ -554,10 +796,7 @@ class MetsToEdmMapper:
                     else literal_or_agent.value
                 )
                 name_results["dcterms_provenance"] += [
-                    Lit(
-                        value="Former owner: " + former_owner_value,
-                        lang="en",
-                    ),
+                    Lit(value="Former owner: " + former_owner_value, lang="en"),
                     Lit(
                         value="Frühere:r Eigentümer:in: " + former_owner_value,
                         lang="de",
@@ -574,27 +813,17 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_edm_rights(cls, dmd_sec: _Element) -> Ref:
-        access_conditions = dmd_sec.xpath(
-            "mods:accessCondition[@xlink:href][1]/@xlink:href",
-            namespaces=METS_MODS_NAMESPACES,
-        )
+        access_conditions = _XP_ACCESS_CONDITION_HREF(dmd_sec)
         if access_conditions:
-            return Ref(value=access_conditions[0].replace("https://", "http://"))
+            return Ref(value=_http_scheme(access_conditions[0]))
 
-        access_conditions = dmd_sec.xpath(
-            "mods:accessCondition[@mods:valueURI][1]/@mods:valueURI",
-            namespaces=METS_MODS_NAMESPACES,
-        )
+        access_conditions = _XP_ACCESS_CONDITION_VALUE_URI(dmd_sec)
         if access_conditions:
-            return Ref(value=access_conditions[0].replace("https://", "http://"))
+            return Ref(value=_http_scheme(access_conditions[0]))
 
-        access_conditions = dmd_sec.xpath(
-            "mods:accessCondition[@type!='hide']", namespaces=METS_MODS_NAMESPACES
-        )
+        access_conditions = _XP_ACCESS_CONDITIONS(dmd_sec)
         if access_conditions:
-            return Ref(
-                value=access_conditions[0].text.strip().replace("https://", "http://")
-            )
+            return Ref(value=_http_scheme(access_conditions[0].text.strip()))
 
         raise Exception("no corresponding field for edm:rights found")
 
@@ -603,20 +832,17 @@ class MetsToEdmMapper:
         cls, dmd_sec: _Element, amd_sec: _Element, default: Optional[str] = None
     ) -> Lit:
         if default:
-            return Lit(value=default)
+            return _lit(default)
 
-        data_provider = amd_sec.find(
-            "mets:rightsMD/mets:mdWrap/mets:xmlData/dv:rights/dv:owner",
-            namespaces=METS_MODS_NAMESPACES,
-        )
-        return Lit(value=data_provider.text)
+        data_provider = amd_sec.find(_PATH_OWNER)
+        return _lit(data_provider.text)
 
     @classmethod
     def get_provider(cls, default: Optional[str]) -> Lit:
         assert (
             default
         ), "Missing value for edm:provider. Either override get_provider or provide a default value to process_record."
-        return Lit(value=default)
+        return _lit(default)
 
     @classmethod
     def get_is_part_of(cls, dmd_sec: _Element) -> List[Any]:
@@ -630,11 +856,9 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_current_location(cls, dmd_sec: _Element) -> Optional[Lit]:
-        location = join_tag_texts_xpath(
-            dmd_sec, "mods:location[1]/mods:physicalLocation[1]"
-        )
+        location = join_tag_texts_xpath(dmd_sec, _XP_PHYSICAL_LOCATION)
         shelf_locator = join_tag_texts_xpath(
-            dmd_sec, "mods:location[1]/mods:shelfLocator", separator=" ; "
+            dmd_sec, _XP_SHELF_LOCATORS, separator=" ; "
         )
         full_location = location + ((" ; " + shelf_locator) if shelf_locator else "")
         return Lit(value=full_location) if full_location else None
@@ -661,28 +885,25 @@ class MetsToEdmMapper:
 
     @classmethod
     def get_iiif_manifest_url(cls, amd_sec: _Element) -> Optional[List[Ref]]:
-        iiif_manifest = amd_sec.find(
-            "mets:digiprovMD/mets:mdWrap/mets:xmlData/dv:links/dv:iiif",
-            namespaces=METS_MODS_NAMESPACES,
-        )
+        iiif_manifest = amd_sec.find(_PATH_IIIF_MANIFEST)
         if iiif_manifest is None:
             return None
         return [Ref(value=iiif_manifest.text)]
 
     @classmethod
     def query_url_for_div(
-        cls, div: _Element, file_sec: _Element, file_grp: str
+        cls,
+        div: _Element,
+        file_sec: _Element,
+        file_grp: str,
+        file_urls: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
-        fptr_id = xpath_first_match(
-            div,
-            f"mets:fptr[contains(@FILEID,'{file_grp}')]/@FILEID",
-        )
+        fptr_id = xpath_first_match(div, _XP_FILE_ID_BY_GRP, file_grp=file_grp)
         # assert fptr_id, "no fptr found"
         if fptr_id:
-            file_url = xpath_first_match(
-                file_sec,
-                f".//mets:file[@ID='{fptr_id}'][1]/mets:FLocat[@LOCTYPE='URL']/@xlink:href",
-            )
+            if file_urls is None:
+                file_urls = index_file_urls(file_sec)
+            file_url = file_urls.get(fptr_id)
             assert file_url, f"file with ID {fptr_id} not found"
             return file_url
         return None
@@ -692,41 +913,43 @@ class MetsToEdmMapper:
         cls,
         physical_div: _Element,
         file_sec: _Element,
-        xpath_query_pages: str = "mets:div[@TYPE='page']",
+        xpath_query_pages: XPathQueryType = _XP_PAGE_DIVS,
         file_grp: str = "DEFAULT",
+        file_urls: Optional[Dict[str, str]] = None,
     ) -> List[str]:
         urls = []
         if physical_div is not None:
-            page_divs = physical_div.xpath(
-                xpath_query_pages, namespaces=METS_MODS_NAMESPACES
-            )
+            if file_urls is None:
+                # the file URLs are looked up for every page, so the fileSec is indexed once
+                file_urls = index_file_urls(file_sec)
+            page_divs = evaluate_xpath(physical_div, xpath_query_pages)
             for page_div in page_divs:
                 # TODO: consider ORDER attributes on page divs
-                file_url = cls.query_url_for_div(page_div, file_sec, file_grp)
+                file_url = cls.query_url_for_div(
+                    page_div, file_sec, file_grp, file_urls=file_urls
+                )
                 if file_url:
                     urls.append(file_url)
         return urls
 
     @classmethod
-    def get_object(cls, logical_div: _Element, file_sec: _Element) -> Optional[Ref]:
+    def get_object(
+        cls,
+        logical_div: _Element,
+        file_sec: _Element,
+        file_urls: Optional[Dict[str, str]] = None,
+    ) -> Optional[Ref]:
         thumbnail_id = (
-            xpath_first_match(
-                logical_div, "mets:fptr[contains(@FILEID,'FRONTIMAGE')]/@FILEID"
-            )
-            or xpath_first_match(
-                logical_div, "mets:fptr[contains(@FILEID,'TEASER')]/@FILEID"
-            )
-            or xpath_first_match(
-                file_sec, "mets:fileGrp[@USE='DEFAULT']/mets:file[@USE='banner']/@ID"
-            )
+            xpath_first_match(logical_div, _XP_FRONTIMAGE_FILE_ID)
+            or xpath_first_match(logical_div, _XP_TEASER_FILE_ID)
+            or xpath_first_match(file_sec, _XP_BANNER_FILE_ID)
         )
         # TODO: last option: get from TitlePage
         if thumbnail_id is None:
             return None
-        thumbnail_url = xpath_first_match(
-            file_sec,
-            f".//mets:file[@ID='{thumbnail_id}'][1]/mets:FLocat[@LOCTYPE='URL']/@xlink:href",
-        )
+        if file_urls is None:
+            file_urls = index_file_urls(file_sec)
+        thumbnail_url = file_urls.get(thumbnail_id)
         return Ref(value=thumbnail_url)
 
     @classmethod
@@ -738,7 +961,10 @@ class MetsToEdmMapper:
         file_sec: _Element,
         context_objects: CONTEXT_DICT_TYPE,
         dmd_sec: _Element,
+        file_urls: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
+        if file_urls is None:
+            file_urls = index_file_urls(file_sec)
         results = {
             "edm_hasView": [],
             "edm_isShownBy": None,
@@ -746,9 +972,9 @@ class MetsToEdmMapper:
             "edm_object": None,
         }
 
-        urls = cls.query_shownBy_urls(physical_div, file_sec)
+        urls = cls.query_shownBy_urls(physical_div, file_sec, file_urls=file_urls)
 
-        edm_object = cls.get_object(logical_div, file_sec)
+        edm_object = cls.get_object(logical_div, file_sec, file_urls=file_urls)
         results["edm_object"] = edm_object
         if edm_object and not urls:
             urls.append(edm_object.value)
@@ -758,6 +984,8 @@ class MetsToEdmMapper:
         first = True
         for url in urls:
             url = url.replace(" ", "%20")
+            # one Ref per url, shared by the web resource and the aggregation
+            url_ref = Ref(value=url)
             service = cls.get_iiif_image_api_service(url)
             has_service = None
             if service:
@@ -765,27 +993,26 @@ class MetsToEdmMapper:
                 has_service = [service.id]
             if iiif_manifest or service:
                 context_objects[url] = EDM_WebResource(
-                    id=Ref(value=url),
+                    id=url_ref,
                     dcterms_isReferencedBy=iiif_manifest,
                     svcs_has_service=has_service,
                 )
             if first:
-                results["edm_isShownBy"] = Ref(value=url)
+                results["edm_isShownBy"] = url_ref
                 first = False
             else:
-                results["edm_hasView"].append(Ref(value=url))
+                results["edm_hasView"].append(url_ref)
 
-        if pdf_url := cls.query_url_for_div(logical_div, file_sec, file_grp="PDF"):
+        if pdf_url := cls.query_url_for_div(
+            logical_div, file_sec, file_grp="PDF", file_urls=file_urls
+        ):
             if first:
                 results["edm_isShownBy"] = Ref(value=pdf_url)
                 first = False
             else:
                 results["edm_hasView"].append(Ref(value=pdf_url))
 
-        shown_ats = uri_list_from_xpath(
-            amd_sec,
-            "mets:digiprovMD/mets:mdWrap/mets:xmlData/dv:links/dv:presentation",
-        )
+        shown_ats = uri_list_from_xpath(amd_sec, _XP_PRESENTATION_LINKS)
         results["edm_isShownAt"] = shown_ats[0]
         if len(shown_ats) > 1:
             results["edm_hasView"] += shown_ats[1:]
@@ -809,19 +1036,35 @@ class MetsToEdmMapper:
 
         context_objects: CONTEXT_DICT_TYPE = {}
 
-        record = record.xpath("//mets:mets", namespaces=METS_MODS_NAMESPACES)[0]
+        if isinstance(record, etree._ElementTree):
+            record = record.getroot()
+        # the descendant search is only needed if the record is wrapped, e.g. in an OAI-PMH response
+        if record.tag != _TAG_METS:
+            record = _XP_METS_ROOT(record)[0]
+        # one pass over the top-level sections, reused by the lookups of dmdSec and amdSec by ID
+        sections = index_mets_sections(record)
         logical_main_div = cls.get_main_structmap_div(record)
-        dmd_sec = cls.get_mods_part(record, dmdid=logical_main_div.get("DMDID"))
-        host_dmd_sec = cls.get_host_dmd_sec(record, dmd_sec, logical_main_div)
+        dmd_sec = cls.get_mods_part(
+            record, dmdid=logical_main_div.get("DMDID"), sections=sections
+        )
+        host_dmd_sec = cls.get_host_dmd_sec(
+            record, dmd_sec, logical_main_div, sections=sections
+        )
 
-        amd_sec = cls.get_amd_part(record, amdid=logical_main_div.get("ADMID"))
+        amd_sec = cls.get_amd_part(
+            record, amdid=logical_main_div.get("ADMID"), sections=sections
+        )
 
-        physical_main_div = record.find(
-            "mets:structMap[@TYPE='PHYSICAL']/mets:div",  # [@TYPE='physSequence']",
-            namespaces=METS_MODS_NAMESPACES,
+        physical_struct_map = sections["structMap"].get("PHYSICAL")
+        physical_main_div = (
+            physical_struct_map.find(_TAG_DIV)  # [@TYPE='physSequence']
+            if physical_struct_map is not None
+            else None
         )
 
-        filesec = record.find("mets:fileSec", namespaces=METS_MODS_NAMESPACES)
+        filesec = sections["fileSec"]
+        # the file URLs are looked up for every page, so the fileSec is indexed once per record
+        file_urls = index_file_urls(filesec) if filesec is not None else {}
 
         edm_type = cls.get_edm_type(dmd_sec, logical_main_div=logical_main_div)
 
@@ -843,33 +1086,43 @@ class MetsToEdmMapper:
         cho = EDM_ProvidedCHO(
             id=Ref(value="1"),  # TODO: id
             **titles,
-            dc_description=cls.get_descriptions(dmd_sec),
+            dc_description=(
+                cls.get_descriptions(dmd_sec) if cls.DESCRIPTIONS_ENABLED else None
+            ),
             edm_type=edm_type,
-            dc_language=[Lit(value=lang) for lang in languages],
-            dc_type=cls.get_types(dmd_sec, logical_main_div)
-            + from_mods_subject["dc_type"],
-            dc_subject=cls.get_subjects(dmd_sec)
-            + from_mods_subject["dc_subject"]
-            + from_mods_name["dc_subject"],
-            dcterms_temporal=cls.get_temporals(dmd_sec)
-            + from_mods_subject["dcterms_temporal"],
-            dcterms_spatial=cls.get_spatials(dmd_sec)
-            + from_mods_subject["dcterms_spatial"],
+            dc_language=[_lit(lang) for lang in languages],
+            dc_type=_concat(
+                cls.get_types(dmd_sec, logical_main_div), from_mods_subject["dc_type"]
+            ),
+            dc_subject=_concat(
+                cls.get_subjects(dmd_sec),
+                from_mods_subject["dc_subject"],
+                from_mods_name["dc_subject"],
+            ),
+            dcterms_temporal=_concat(
+                cls.get_temporals(dmd_sec), from_mods_subject["dcterms_temporal"]
+            ),
+            dcterms_spatial=_concat(
+                cls.get_spatials(dmd_sec), from_mods_subject["dcterms_spatial"]
+            ),
             dc_identifier=cls.get_identifiers(dmd_sec),
             dcterms_medium=cls.get_mediums(dmd_sec),
             dcterms_extent=cls.get_extent(dmd_sec),
-            dc_publisher=cls.get_publishers(dmd_sec=dmd_sec, host_dmd_sec=host_dmd_sec)
-            + from_mods_name["dc_publisher"],
+            dc_publisher=_concat(
+                cls.get_publishers(dmd_sec=dmd_sec, host_dmd_sec=host_dmd_sec),
+                from_mods_name["dc_publisher"],
+            ),
             dc_creator=from_mods_name["dc_creator"],
             dc_contributor=from_mods_name["dc_contributor"],
-            dcterms_provenance=from_mods_name["dcterms_provenance"]
-            + cls.get_provenance(dmd_sec),
+            dcterms_provenance=_concat(
+                from_mods_name["dcterms_provenance"], cls.get_provenance(dmd_sec)
+            ),
             dcterms_issued=cls.get_issued(dmd_sec),
             dcterms_created=cls.get_created(dmd_sec),
             dcterms_isPartOf=cls.get_is_part_of(dmd_sec),
             dcterms_isReferencedBy=cls.get_referenced_by(dmd_sec, context_objects),
             edm_currentLocation=cls.get_current_location(dmd_sec),
-            dc_rights=cls.get_dc_rights(dmd_sec) + from_mods_name["dc_rights"],
+            dc_rights=_concat(cls.get_dc_rights(dmd_sec), from_mods_name["dc_rights"]),
         )
 
         provider = cls.get_provider(default=edm_provider)
@@ -888,9 +1141,70 @@ class MetsToEdmMapper:
                 filesec,
                 context_objects,
                 dmd_sec,
+                file_urls=file_urls,
             ),
         )
 
         context_classes = context_dict_to_edm_record_dict(context_objects)
 
         return EDM_Record(provided_cho=cho, aggregation=aggregation, **context_classes)
+
+    @classmethod
+    def process_file(
+        cls,
+        path: str,
+        edm_provider: Optional[str] = None,
+        data_provider: Optional[str] = None,
+    ) -> EDM_Record:
+        """Parses a METS/MODS file with METS_PARSER_OPTIONS and maps it to EDM, see process_record"""
+        record = etree.parse(path, etree.XMLParser(**METS_PARSER_OPTIONS)).getroot()
+        return cls.process_record(
+            record, edm_provider=edm_provider, data_provider=data_provider
+        )
+
+
+def _process_serialized_record(
+    mapper_class: Type[MetsToEdmMapper],
+    edm_provider: Optional[str],
+    data_provider: Optional[str],
+    record: bytes,
+) -> bytes:
+    edm_record = mapper_class.process_record(
+        etree.fromstring(record, etree.XMLParser(**METS_PARSER_OPTIONS)),
+        edm_provider=edm_provider,
+        data_provider=data_provider,
+    )
+    return edm_record.get_rdf_graph().serialize(
+        format="pretty-xml", max_depth=1, encoding="utf-8"
+    )
+
+
+def process_records(
+    records: Iterable[bytes],
+    edm_provider: Optional[str] = None,
+    data_provider: Optional[str] = None,
+    mapper_class: Type[MetsToEdmMapper] = MetsToEdmMapper,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[bytes]:
+    """Maps independent METS/MODS records in parallel worker processes
+
+    lxml elements can't be passed between processes, so the records are given as serialized XML and the
+    EDM records are returned as utf-8 encoded rdf/xml, in the order of the input records.
+
+    Args:
+        records: serialized METS/MODS records
+        edm_provider: see process_record
+        data_provider: see process_record
+        mapper_class: MetsToEdmMapper or a subclass of it, must be importable by the worker processes (e.g. not defined in __main__ or inside a function)
+        workers: number of worker processes, defaults to the number of CPUs
+        chunksize: number of records sent to a worker at once
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            functools.partial(
+                _process_serialized_record, mapper_class, edm_provider, data_provider
+            ),
+            records,
+            chunksize=chunksize,
+        )
@@ -1,33 +1,64 @@
-from typing import TypedDict, Callable
-
-from edmlib import EDM_TimeSpan, EDM_WebResource, MixedValuesList
+import functools
+import sys
+from typing import TypedDict, Callable, Optional, Union
+
+from edmlib import (
+    EDM_Agent,
+    EDM_Place,
+    EDM_TimeSpan,
+    EDM_WebResource,
+    MixedValuesList,
+    SKOS_Concept,
+    SVCS_Service,
+)
 from edmlib.edm import Lit, Ref
 from edmlib.edm.base import EDM_BaseClass
+from lxml import etree
 from lxml.etree import _Element
 
 CONTEXT_DICT_TYPE = dict[str, EDM_BaseClass]
 
+# EDM_Record field of every context class, looked up by the exact type of the context object
+CONTEXT_CLASS_FIELDS = {
+    EDM_WebResource: "web_resource",
+    EDM_TimeSpan: "edm_time_span",
+    EDM_Agent: "edm_agent",
+    EDM_Place: "edm_place",
+    SKOS_Concept: "skos_concept",
+    SVCS_Service: "svcs_service",
+}
+# fields of other context classes (e.g. subclasses), resolved once per class
+_SUBCLASS_FIELDS: dict[type, str] = {}
+
+
+def _context_subclass_field(context_class: type) -> str:
+    field = _SUBCLASS_FIELDS.get(context_class)
+    if field is None:
+        if issubclass(context_class, EDM_WebResource):
+            field = "web_resource"
+        elif issubclass(context_class, EDM_TimeSpan):
+            field = "edm_time_span"
+        else:
+            field = context_class.__name__.lower()
+        _SUBCLASS_FIELDS[context_class] = field
+    return field
+
 
 def context_dict_to_edm_record_dict(
     context_objects: CONTEXT_DICT_TYPE,
 ) -> dict[str, list[EDM_BaseClass]]:
-    context_classes = {
-        "edm_agent": [],
-        "edm_place": [],
-        "edm_time_span": [],
-        "skos_concept": [],
-        "svcs_service": [],
-        "web_resource": [],
-    }
+    # only fields that received context objects are returned, the other EDM_Record fields keep their default
+    context_classes = {}
     for context_object in context_objects.values():
-        if isinstance(context_object, EDM_WebResource):
-            context_classes["web_resource"].append(context_object)
-        elif isinstance(context_object, EDM_TimeSpan):
-            context_classes["edm_time_span"].append(context_object)
+        context_class = type(context_object)
+        field = CONTEXT_CLASS_FIELDS.get(context_class)
+        if field is None:
+            field = _context_subclass_field(context_class)
+        bucket = context_classes.get(field)
+        if bucket is None:
+            context_classes[field] = [context_object]
         else:
-            context_classes[type(context_object).__name__.lower()].append(
-                context_object
-            )
+            bucket.append(context_object)
     return context_classes
 
 
@@ -41,6 +72,15 @@ METS_MODS_NAMESPACES = {
     "ext": "http://ns.vls.io/mods",
 }
 
+# Options for parsing METS/MODS input with lxml: xml:id lookups are not needed for the mapping and blank text
+# between elements (indentation) is dropped to keep the tree small
+METS_PARSER_OPTIONS = {
+    "huge_tree": True,
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "resolve_entities": False,
+}
+
 ModsNameResultsType = TypedDict(
     "ModsNameResultsType",
     {
@@ -49,61 +89,107 @@ ModsNameResultsType = TypedDict(
         "dc_contributor": MixedValuesList,
         "dcterms_provenance": MixedValuesList,
         "dc_subject": MixedValuesList,
+        "dc_rights": MixedValuesList,
+    },
+)
+
+# top-level sections of a mets:mets element, dmdSec and amdSec by ID and structMap by TYPE
+MetsSectionsType = TypedDict(
+    "MetsSectionsType",
+    {
+        "dmdSec": dict[str, _Element],
+        "amdSec": dict[str, _Element],
+        "structMap": dict[str, _Element],
+        "fileSec": Optional[_Element],
+    },
+)
+
+ModsSubjectResultsType = TypedDict(
+    "ModsSubjectResultsType",
+    {
+        "dc_subject": MixedValuesList,
+        "dcterms_spatial": MixedValuesList,
+        "dcterms_temporal": MixedValuesList,
+        "dc_type": MixedValuesList,
     },
 )
 
 
-def xpath_first_match(element: _Element, xpath_query):
-    results = element.xpath(xpath_query, namespaces=METS_MODS_NAMESPACES)
+XPathQueryType = Union[str, etree.XPath]
+
+
+@functools.lru_cache(maxsize=512)
+def compiled_xpath(xpath_query: str) -> etree.XPath:
+    # XPath strings are compiled once with the METS/MODS namespaces and reused for every element
+    return etree.XPath(xpath_query, namespaces=METS_MODS_NAMESPACES)
+
+
+# the helpers accept XPath strings as well as precompiled etree.XPath objects for queries evaluated per record,
+# keyword arguments are bound to the $variables of the query
+def evaluate_xpath(element: _Element, xpath_query: XPathQueryType, **variables):
+    if isinstance(xpath_query, etree.XPath):
+        return xpath_query(element, **variables)
+    return compiled_xpath(xpath_query)(element, **variables)
+
+
+def xpath_first_match(element: _Element, xpath_query: XPathQueryType, **variables):
+    results = evaluate_xpath(element, xpath_query, **variables)
     return results[0] if results else None
 
 
 def join_tag_texts(elements: list[_Element], separator=" "):
-    if len(elements) > 0:
-        return separator.join([element.text for element in elements if element.text])
-    else:
-        return ""
+    # joining no texts already results in an empty string
+    return separator.join([element.text for element in elements if element.text])
 
 
-def join_tag_texts_xpath(element: _Element, xpath_query, separator=" "):
-    return join_tag_texts(
-        element.xpath(xpath_query, namespaces=METS_MODS_NAMESPACES),
-        separator=separator,
-    )
+def join_tag_texts_xpath(element: _Element, xpath_query: XPathQueryType, separator=" "):
+    return join_tag_texts(evaluate_xpath(element, xpath_query), separator=separator)
 
 
 def literal_list_from_xpath(
     element: _Element,
-    xpath_query,
+    xpath_query: XPathQueryType,
     string_extract_function: Callable[[_Element], str] = None,
 ):
+    # Lit is bound locally so it isn't looked up in the module globals for every tag
+    lit = Lit
+    tags = evaluate_xpath(element, xpath_query)
+    # the extraction doesn't change between tags, so it is decided once instead of in every iteration
+    if string_extract_function is None:
+        return [
+            lit(value=extracted, lang=tag.get("lang"))
+            for tag in tags
+            if (extracted := tag.text)
+        ]
     return [
-        Lit(
-            value=extracted,
-            lang=tag.get("lang"),
-        )
-        for tag in element.xpath(xpath_query, namespaces=METS_MODS_NAMESPACES)
-        if (
-            extracted := (
-                string_extract_function(tag) if string_extract_function else tag.text
-            )
-        )
+        lit(value=extracted, lang=tag.get("lang"))
+        for tag in tags
+        if (extracted := string_extract_function(tag))
     ]
 
 
-def first_literal_from_xpath(element: _Element, xpath_query):
+def first_literal_from_xpath(element: _Element, xpath_query: XPathQueryType):
     literal_list = literal_list_from_xpath(element, xpath_query)
     if literal_list:
         return literal_list[0]
     return None
 
 
-def uri_list_from_xpath(element: _Element, xpath_query):
-    return [
-        Ref(value=tag.text)
-        for tag in element.xpath(xpath_query, namespaces=METS_MODS_NAMESPACES)
-    ]
+def uri_list_from_xpath(element: _Element, xpath_query: XPathQueryType):
+    ref = Ref
+    return [ref(value=tag.text) for tag in evaluate_xpath(element, xpath_query)]
+
+
+# the names used by the mapping are a small closed set, so every qualified name is built and interned only once
+@functools.lru_cache(maxsize=None)
+def qualified_name(prefix: str, tag_name: str) -> str:
+    """Name in Clark notation ({namespace}tag_name) for a prefix of METS_MODS_NAMESPACES"""
+    return sys.intern("{" + METS_MODS_NAMESPACES[prefix] + "}" + tag_name)
 
 
 def mods_ns(tag_name: str):
-    return "{" + METS_MODS_NAMESPACES["mods"] + "}" + tag_name
+    return qualified_name("mods", tag_name)
+
+
+def mets_ns(tag_name: str):
+    return qualified_name("mets", tag_name)
@@ -0,0 +1,65 @@
+import pytest
+from lxml import etree
+
+from mets_to_edm.utilities import METS_PARSER_OPTIONS
+
+# a minimal record with everything process_record needs, the LABEL, additional MODS elements and the
+# attributes of the logical main div can be changed per test
+RECORD_TEMPLATE = """<mets:mets xmlns:mets="http://www.loc.gov/METS/" xmlns:mods="http://www.loc.gov/mods/v3"
+    xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:dv="http://dfg-viewer.de/" LABEL="{label}">
+  <mets:dmdSec ID="DMDLOG_0000">
+    <mets:mdWrap MDTYPE="MODS"><mets:xmlData><mods:mods>
+      <mods:part><mods:date>1899</mods:date></mods:part>
+      <mods:language><mods:languageTerm type="code">ger</mods:languageTerm></mods:language>
+      <mods:accessCondition type="use and reproduction"
+        xlink:href="https://creativecommons.org/publicdomain/mark/1.0/"/>
+      {mods}
+    </mods:mods></mets:xmlData></mets:mdWrap>
+  </mets:dmdSec>
+  <mets:amdSec ID="AMD">
+    <mets:rightsMD ID="RIGHTS"><mets:mdWrap MDTYPE="OTHER"><mets:xmlData>
+      <dv:rights><dv:owner>Owner</dv:owner></dv:rights>
+    </mets:xmlData></mets:mdWrap></mets:rightsMD>
+    <mets:digiprovMD ID="DIGIPROV"><mets:mdWrap MDTYPE="OTHER"><mets:xmlData>
+      <dv:links><dv:presentation>https://example.org/record</dv:presentation></dv:links>
+    </mets:xmlData></mets:mdWrap></mets:digiprovMD>
+  </mets:amdSec>
+  <mets:fileSec>
+    <mets:fileGrp USE="DEFAULT">
+      <mets:file ID="FILE_0001_DEFAULT">
+        <mets:FLocat LOCTYPE="URL" xlink:href="https://example.org/image/1.jpg"/>
+      </mets:file>
+    </mets:fileGrp>
+  </mets:fileSec>
+  <mets:structMap TYPE="PHYSICAL">
+    <mets:div ID="PHYS_0000" TYPE="physSequence">
+      <mets:div ID="PHYS_0001" TYPE="page"><mets:fptr FILEID="FILE_0001_DEFAULT"/></mets:div>
+    </mets:div>
+  </mets:structMap>
+  <mets:structMap TYPE="LOGICAL">
+    <mets:div ID="LOG_0000" TYPE="monograph" {div_attributes}/>
+  </mets:structMap>
+</mets:mets>"""
+
+
+def record_xml(
+    label: str = "Label",
+    mods: str = "",
+    div_attributes: str = 'DMDID="DMDLOG_0000" ADMID="AMD"',
+) -> str:
+    return RECORD_TEMPLATE.format(label=label, mods=mods, div_attributes=div_attributes)
+
+
+@pytest.fixture
+def mets_record_xml():
+    return record_xml
+
+
+@pytest.fixture
+def parse_record():
+    def parse(**kwargs):
+        return etree.fromstring(
+            record_xml(**kwargs), etree.XMLParser(**METS_PARSER_OPTIONS)
+        )
+
+    return parse
@@ -0,0 +1,37 @@
+import os
+import sys
+
+from lxml import etree
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "examples",
+        "1_customized_mapping_iiif_image_api",
+    ),
+)
+
+from customized_mapping import MetsModsMapperWithIIIF  # noqa: E402
+
+
+def test_indented_identifiers_are_kept():
+    mods = etree.fromstring(
+        """<mods:mods xmlns:mods="http://www.loc.gov/mods/v3">
+            <mods:recordInfo>
+                <mods:recordIdentifier>
+                    urn:rec
+                </mods:recordIdentifier>
+            </mods:recordInfo>
+            <mods:identifier type="urn">
+                urn:nbn:at:test
+            </mods:identifier>
+            <mods:identifier type="local">  local-1  </mods:identifier>
+        </mods:mods>"""
+    )
+    identifiers = MetsModsMapperWithIIIF.get_identifiers(mods)
+    assert [identifier.value for identifier in identifiers] == [
+        "urn:rec",
+        "urn:nbn:at:test",
+    ]
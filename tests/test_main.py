@@ -0,0 +1,95 @@
+import os
+
+from lxml import etree
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib.namespace import DC
+
+from mets_to_edm import MetsToEdmMapper, process_records
+from mets_to_edm.__main__ import map_file, map_files
+
+EXAMPLE_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "examples",
+    "1_customized_mapping_iiif_image_api",
+    "example-1.xml",
+)
+
+
+def _graph(serialized_record: bytes) -> Graph:
+    return Graph().parse(data=serialized_record, format="xml", publicID="x:/")
+
+
+def test_workers_output_equals_serial_output(tmp_path, capsys):
+    invalid_file = tmp_path / "invalid.xml"
+    invalid_file.write_text("<mets:mets")
+    unmappable_file = tmp_path / "unmappable.xml"
+    unmappable_file.write_text(
+        '<mets:mets xmlns:mets="http://www.loc.gov/METS/"><mets:structMap TYPE="LOGICAL">'
+        '<mets:div DMDID="MISSING"/></mets:structMap></mets:mets>'
+    )
+    paths = [
+        EXAMPLE_FILE,
+        str(invalid_file),
+        str(unmappable_file),
+        str(tmp_path / "missing.xml"),
+        EXAMPLE_FILE,
+    ]
+
+    serial = list(map_file(EXAMPLE_FILE, "Kulturpool")) * 2
+    parallel = list(map_files(paths, "Kulturpool", workers=2))
+
+    # the serialization order of rdflib differs between processes, so the graphs are compared
+    assert len(parallel) == len(serial) == 2
+    for parallel_record, serial_record in zip(parallel, serial):
+        assert isomorphic(_graph(parallel_record), _graph(serial_record))
+    # failing files are reported, the others are still mapped
+    errors = capsys.readouterr().err
+    assert "invalid.xml" in errors
+    assert "unmappable.xml" in errors
+    assert "missing.xml" in errors
+
+
+def _titles(serialized_record: bytes):
+    return sorted(
+        str(title) for title in _graph(serialized_record).objects(None, DC.title)
+    )
+
+
+def test_map_file_maps_every_record_of_an_oai_response(tmp_path, mets_record_xml):
+    oai_file = tmp_path / "oai.xml"
+    oai_file.write_text(
+        '<?xml version="1.0"?>\n<?xml-stylesheet href="oai.xsl"?><!-- exported -->'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><ListRecords>'
+        + "".join(
+            f"<record><metadata>{mets_record_xml(label=label)}</metadata></record>"
+            for label in ("FIRST LABEL", "SECOND LABEL")
+        )
+        + "</ListRecords></OAI-PMH>"
+    )
+    serialized_records = list(map_file(str(oai_file), "Test"))
+    assert [_titles(serialized_record) for serialized_record in serialized_records] == [
+        ["FIRST LABEL 1899"],
+        ["SECOND LABEL 1899"],
+    ]
+
+
+def test_process_records_equals_serial_output(mets_record_xml):
+    records = [
+        mets_record_xml(label=label).encode("utf-8")
+        for label in ("FIRST LABEL", "SECOND LABEL", "THIRD LABEL")
+    ]
+    serialized_records = list(
+        process_records(records, edm_provider="Test", workers=2, chunksize=1)
+    )
+    for serialized_record, record in zip(serialized_records, records):
+        serial_graph = MetsToEdmMapper.process_record(
+            etree.fromstring(record), edm_provider="Test"
+        ).get_rdf_graph()
+        assert isomorphic(_graph(serialized_record), serial_graph)
+    assert [_titles(serialized_record) for serialized_record in serialized_records] == [
+        ["FIRST LABEL 1899"],
+        ["SECOND LABEL 1899"],
+        ["THIRD LABEL 1899"],
+    ]
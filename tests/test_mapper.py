@@ -0,0 +1,82 @@
+import pytest
+from edmlib import EDM_Place, SKOS_Concept
+from lxml import etree
+
+from mets_to_edm import MetsToEdmMapper
+from mets_to_edm.mapper import index_mets_sections
+from mets_to_edm.utilities import mods_ns
+
+
+def test_languages_are_plain_strings(parse_record):
+    # the literals of languages are shared across records, they must not reference the parsed document
+    mods = parse_record().find(".//{http://www.loc.gov/mods/v3}mods")
+    assert [type(language) for language in MetsToEdmMapper.get_languages(mods)] == [str]
+
+
+def test_label_title_fallback(parse_record):
+    edm_record = MetsToEdmMapper.process_record(parse_record(), edm_provider="Test")
+    assert [title.value for title in edm_record.provided_cho.dc_title] == ["Label 1899"]
+
+
+def test_div_without_admid_is_not_bound_to_an_amdsec(parse_record):
+    record = parse_record(div_attributes='DMDID="DMDLOG_0000"')
+    record.find("{http://www.loc.gov/METS/}amdSec").attrib.pop("ID")
+    with pytest.raises(ValueError):
+        MetsToEdmMapper.process_record(record, edm_provider="Test")
+
+
+def test_sections_without_id_are_not_indexed(parse_record):
+    record = parse_record()
+    record.find("{http://www.loc.gov/METS/}amdSec").attrib.pop("ID")
+    assert index_mets_sections(record)["amdSec"] == {}
+    with pytest.raises(ValueError):
+        MetsToEdmMapper.get_amd_part(record, amdid=None)
+
+
+class MapperWithCoverage(MetsToEdmMapper):
+    SUBJECT_SUBELEMENTS_MAPPING = {
+        **MetsToEdmMapper.SUBJECT_SUBELEMENTS_MAPPING,
+        mods_ns("cartographics"): ("dcterms_spatial", EDM_Place),
+        mods_ns("occupation"): ("dc_coverage", SKOS_Concept),
+    }
+
+
+def test_subject_subelements_mapped_to_further_properties(parse_record):
+    mods = parse_record(
+        mods="""<mods:subject>
+            <mods:topic>Topic</mods:topic>
+            <mods:occupation>Occupation</mods:occupation>
+        </mods:subject>"""
+    ).find(".//{http://www.loc.gov/mods/v3}mods")
+    edm_values = MapperWithCoverage.parse_mods_subjects(mods, {})
+    assert [value.value for value in edm_values["dc_subject"]] == ["Topic"]
+    assert [value.value for value in edm_values["dc_coverage"]] == ["Occupation"]
+
+
+def test_second_record_of_an_oai_response(parse_record):
+    response = etree.fromstring(
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><ListRecords>'
+        + "".join(
+            f"<record><metadata>{etree.tostring(parse_record(label=label)).decode()}</metadata></record>"
+            for label in ("FIRST LABEL", "SECOND LABEL")
+        )
+        + "</ListRecords></OAI-PMH>"
+    )
+    second_record = response[0][1]
+    edm_record = MetsToEdmMapper.process_record(second_record, edm_provider="Test")
+    assert [title.value for title in edm_record.provided_cho.dc_title] == [
+        "SECOND LABEL 1899"
+    ]
+
+
+class MapperWithIllustratorsAsCreators(MetsToEdmMapper):
+    CREATOR_ROLES = MetsToEdmMapper.CREATOR_ROLES + ["ill"]
+    OTHER_ROLES = [role for role in MetsToEdmMapper.OTHER_ROLES if role != "ill"]
+
+
+def test_role_lists_extended_by_subclasses():
+    assert MetsToEdmMapper.get_edm_property_for_roles(["ill"]) == "dc_contributor"
+    assert (
+        MapperWithIllustratorsAsCreators.get_edm_property_for_roles(["ill"])
+        == "dc_creator"
+    )
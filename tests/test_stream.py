@@ -0,0 +1,20 @@
+import os
+
+from lxml import etree
+
+from mets_to_edm.__main__ import map_file, stream_records
+
+EXAMPLE_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "examples",
+    "1_customized_mapping_iiif_image_api",
+    "example-1.xml",
+)
+
+
+def test_streamed_records_are_well_formed(capsysbinary):
+    stream_records(map_file(EXAMPLE_FILE, "Kulturpool"))
+    root = etree.fromstring(capsysbinary.readouterr().out)
+    assert root.tag == "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF"
+    assert len(root) > 0